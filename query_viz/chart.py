@@ -28,6 +28,11 @@ class ChartGenerator:
         # Validate chart type and template file
         if not os.path.exists(self.template_file):
             raise QueryVizError(f"Template file for chart type '{chart_type}' not found: {self.template_file}")
+        
+        # The template and the output path never change, so we only read
+        # and compute them once
+        self.template = self._read_template()
+        self.output_path = os.path.join(self.output_dir, self.plot_config['output_file'])
     
     def generate_all_charts(self, chart_queries):
         """Generate all charts using Gnuplot"""
@@ -36,13 +41,17 @@ class ChartGenerator:
         if script_file:
             return self._execute_gnuplot(script_file)
     
-    def _generate_gnuplot_script(self, chart_queries):
-        """Generate Gnuplot script from template"""
+    def _read_template(self):
+        """Read the Gnuplot template file"""
         try:
             with open(self.template_file, 'r') as f:
-                template = f.read()
+                return f.read()
         except FileNotFoundError:
             raise QueryVizError(f"{self.template_file} not found")
+    
+    def _generate_gnuplot_script(self, chart_queries):
+        """Generate Gnuplot script from template"""
+        template = self.template
         
         # Check if any query uses timestamp format
         has_timestamp = False
@@ -115,7 +124,7 @@ class ChartGenerator:
         script_content = template
         script_content = script_content.replace('{{CHART_WIDTH}}', str(self.plot_config['chart_width']))
         script_content = script_content.replace('{{CHART_HEIGHT}}', str(self.plot_config['chart_height']))
-        script_content = script_content.replace('{{OUTPUT_FILE}}', os.path.join(self.output_dir, self.plot_config['output_file']))
+        script_content = script_content.replace('{{OUTPUT_FILE}}', self.output_path)
         script_content = script_content.replace('{{TITLE}}', self.plot_config['title'])
         script_content = script_content.replace('{{XLABEL}}', xlabel)
         script_content = script_content.replace('{{YLABEL}}', self.plot_config['ylabel'])
@@ -153,7 +162,7 @@ set xtics rotate by -45
                 print(f"Gnuplot error: {result.stderr}")
                 return False
             else:
-                print(f"Plot generated: {os.path.join(self.output_dir, self.plot_config['output_file'])}")
+                print(f"Plot generated: {self.output_path}")
                 return True
         except FileNotFoundError:
             print("Warning: gnuplot not found, script generated but plot not created")
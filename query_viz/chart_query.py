@@ -95,16 +95,21 @@ class ChartQuery:
                 title = f"{self.query_name}-{col_name}"
                 specs.append((i, title))
         else:
-            # Use selected columns only
+            # Use selected columns only.
+            # Like list.index(), we use the first column with a given name
+            column_positions = {}
+            for i, col_name in enumerate(column_names, 1):  # 1-based indexing
+                column_positions.setdefault(col_name, i)
+            
             for column_name, alias in self.column_mappings:
                 if column_name == 'time':
                     self.error("Cannot select 'time' column as a metric")
                 
-                if column_name not in column_names:
+                col_index = column_positions.get(column_name)
+                if col_index is None:
                     available_columns = ', '.join(column_names)
                     self.error(f"Column '{column_name}' not found. Available columns: {available_columns}")
                 
-                col_index = column_names.index(column_name) + 1  # Convert to 1-based indexing
                 title = alias
                 specs.append((col_index, title))
         
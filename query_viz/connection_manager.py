@@ -5,12 +5,17 @@ Connection management for QueryViz - handles database connections and retries
 import importlib.util
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .database import SUCCESS, FAIL
 from .database.base import DatabaseConnection
 from .exceptions import QueryVizError
 
 
+# Maximum number of connections probed at the same time
+MAX_PROBE_WORKERS = 16
+
+
 class ConnectionManager:
     """Manages database connections for QueryViz"""
     
@@ -150,6 +155,26 @@ class ConnectionManager:
         """
         return connection_name in self.connections
     
+    def get_connection(self, connection_name):
+        """
+        Return the connection object with the given name.
+        Connection objects are never replaced after setup, so callers
+        can keep a reference instead of looking it up repeatedly.
+        
+        Args:
+            connection_name (str): Name of the connection
+            
+        Returns:
+            DatabaseConnection: The connection object
+            
+        Raises:
+            QueryVizError: If connection name doesn't exist
+        """
+        if connection_name not in self.connections:
+            raise QueryVizError(f"Connection '{connection_name}' not found")
+        
+        return self.connections[connection_name]
+    
     def connection_has_failed(self, connection_name):
         """
         Check if a connection has failed
@@ -277,21 +302,22 @@ class ConnectionManager:
             failed_connections = 0
             total_connections = len(self.connections)
             
-            for conn_name, connection in self.connections.items():
-                if connection.status == SUCCESS:
-                    continue
-                try:
-                    print("Connection attempt to '" + connection.config['host'] + "'... ", end="")
-                    connection.connect()
+            pending = {conn_name: connection for conn_name, connection in self.connections.items()
+                       if connection.status != SUCCESS}
+            self._probe_connections(pending)
+            
+            for conn_name, connection in pending.items():
+                print("Connection attempt to '" + connection.config['host'] + "'... ", end="")
+                if connection.status != FAIL:
                     print("success")
-                except QueryVizError as e:
+                else:
                     failed_connections += 1
                     elapsed_time = time.time() - start_time
                     if elapsed_time >= initial_grace_period:
                         print("fail. WON'T RETRY")
                     else:
                         print("fail. Will retry")
-                    print(f"    Reason: {e}")
+                    print(f"    Reason: {connection.last_error}")
             
             if failed_connections > 0:
                 print(f"{failed_connections}/{total_connections} connections are not working")
@@ -342,9 +368,8 @@ class ConnectionManager:
         failed_connections_interval = config['failed_connections_interval']
         
         while query_viz_instance.running:
-            time.sleep(failed_connections_interval)
-            
-            if not query_viz_instance.running:
+            # Wake up immediately on shutdown
+            if query_viz_instance.wait_for_shutdown(failed_connections_interval):
                 break
             
             # Retry failed connections
@@ -363,15 +388,37 @@ class ConnectionManager:
         retries_attempted = False
         
         # Check for failed connections and try to reconnect
-        for conn_name, connection in self.connections.items():
-            if connection.status == FAIL:
-                try:
-                    print(f"Retrying connection '{conn_name}'...")
-                    connection.connect()
-                    print(f"Connection '{conn_name}': Reconnected successfully")
-                    retries_attempted = True
-                except QueryVizError:
-                    # Connection still failed, status already set to FAIL in connect()
-                    pass
+        failed = {conn_name: connection for conn_name, connection in self.connections.items()
+                  if connection.status == FAIL}
+        for conn_name in failed:
+            print(f"Retrying connection '{conn_name}'...")
+        
+        self._probe_connections(failed)
+        for conn_name, connection in failed.items():
+            # If the connection still failed, status is still FAIL
+            if connection.status != FAIL:
+                print(f"Connection '{conn_name}': Reconnected successfully")
+                retries_attempted = True
         
         return retries_attempted
+    
+    def _probe_connections(self, connections):
+        """
+        Call try_connect() on the specified connections concurrently,
+        so that a sweep takes as long as the slowest connection rather
+        than the sum of all connection timeouts.
+        Afterwards, each connection's status tells whether it succeeded,
+        and last_error tells why it failed.
+        
+        Args:
+            connections (dict): Connections to probe, by name
+        """
+        if not connections:
+            return
+        
+        workers = min(MAX_PROBE_WORKERS, len(connections))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(connection.try_connect) for connection in connections.values()]
+            for future in as_completed(futures):
+                # Only unexpected errors are raised here
+                future.result()
@@ -4,12 +4,23 @@ Main QueryViz application class
 
 import sys
 import time
+import json
+import hashlib
 import yaml
 import threading
 import signal
 import re
 import os
-from collections import defaultdict, deque
+import heapq
+from collections import deque
+from functools import lru_cache
+
+# The C loader is much faster, but it's only available if PyYAML
+# was built with LibYAML
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from .query import QueryConfig
 from .chart import ChartGenerator
@@ -17,55 +28,114 @@ from .chart_query import ChartQuery
 from .data_file import DataFile
 from .data_file_set import DataFileSet
 from .connection_manager import ConnectionManager
+from .database import FAIL
 from .exceptions import QueryVizError
+from .filename import normalise_filename
 from .interval import Interval
+from .ring_buffer import RingBuffer
+from .worker_pool import WorkerPool
 
 
 # Minimum allowed value for on_rotation_keep_datapoints
 MIN_ON_ROTATION_KEEP_DATAPOINTS = 60
 
+# The validated configuration is cached in a JSON file next to the YAML file,
+# together with a hash of the YAML file content and a hash of the query-viz
+# source code, so that any change to validation invalidates older caches.
+# Increase the version when the cache file format changes
+CONFIG_CACHE_SUFFIX = '.cache.json'
+CONFIG_CACHE_SCHEMA_VERSION = 4
+# The cache contains passwords, so only the owner can read it
+CONFIG_CACHE_FILE_MODE = 0o600
+
+# Chart dimensions in the "800x600" format
+_CHART_SIZE_RE = re.compile(r'^(\d+)x(\d+)$')
+
+# Fields that _validate_config() requires in each section
+REQUIRED_CONNECTION_FIELDS = ('name', 'dbms', 'host', 'port', 'user', 'password')
+REQUIRED_CHART_FIELDS = ('ylabel',)
+REQUIRED_GLOBAL_FIELDS = (
+      'interval'
+    , 'failed_connections_interval'
+    , 'initial_grace_period'
+    , 'grace_period_retry_interval'
+    , 'once_thread_delay'
+    , 'db_connection_timeout_seconds'
+)
+
+
+@lru_cache(maxsize=None)
+def _source_fingerprint():
+    """
+    Return a hash of the query-viz source files, computed once per process.
+    
+    Returns:
+        str: Hex digest of the paths and contents of the package's .py files
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith('.py'):
+                continue
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, package_dir).encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
 
 class QueryViz:
     """Main query-viz application"""
     def __init__(self, verbosity_level, config_file='config.yaml'):
         self.config_file = config_file
         self.config = None
+        # Warnings printed by _validate_config(). They're cached with the
+        # configuration, and printed again when the cache is used
+        self.config_warnings = []
         # All interactions with the databases should be handled by ConnectionManager
         self.connection_manager = ConnectionManager()
         self.queries = []
+        # queries partitioned by execution type
+        self.once_queries = []
+        self.recurring_queries = []
         # fast loopup of a single query object
         self.queries_by_name = {}
         # query list per chart
         self.chart_queries = {}
         # chart generators per chart
         self.chart_generators = {}
-        # store max 1000 data points
-        self.data = defaultdict(lambda: deque(maxlen=1000))
+        # store max 1000 data points per query, unboxed.
+        # Populated by setup_queries(), when query names are known
+        self.data = {}
         # store max 1000 timestamps
         self.timestamps = deque(maxlen=1000)
         # if True, we'll cleanly exit the execution loop
         self.running = False
+        # set on shutdown, to wake up the main loop immediately
+        self._stop_event = threading.Event()
+        # set when a recurring query returns its first sample,
+        # to wake up the main loop and draw the first charts
+        self._first_sample_event = threading.Event()
         self.threads = []
         self.data_files = {}
-        # this is a basic, incomplete protection
-        # but it's enough, because in practice no file can be written by multiple threads
-        self.data_lock = threading.Lock()
-        # TODO: output_dir should be created if it doesn't exist
+        # No lock is needed for data and Data Files: each of them is written
+        # by a single query thread. timestamps are only appended to.
+        # created by run() if it doesn't exist
         self.output_dir = '/app/output'
+        # Validated global settings, bound once by _bind_global_settings()
+        # so that loops don't need to look them up in self.config
+        self.interval = None
+        self.failed_connections_interval = None
+        self.initial_grace_period = None
+        self.grace_period_retry_interval = None
+        self.once_thread_delay = None
+        self.db_connection_timeout = None
     
     def normalise_filename(self, basename, extension):
         """Normalise a filename by removing special characters and standardising format"""
-        # Only keep alphanumeric, spaces, underscores, hyphens
-        normalised = re.sub(r'[^a-zA-Z0-9\s_-]', '', basename)
-        # Convert spaces and underscores to dashes
-        normalised = re.sub(r'[\s_]+', '-', normalised)
-        # Collapse consecutive dashes into one dash
-        normalised = re.sub(r'-+', '-', normalised)
-        normalised = normalised.strip('-')
-        normalised = normalised.lower()
-        if extension:
-            return f"{normalised}.{extension}"
-        return normalised
+        return normalise_filename(basename, extension)
     
     def exit(self, code=0):
         """Exit with code 0 if running in Docker, otherwise use specified code"""
@@ -74,26 +144,139 @@ class QueryViz:
         sys.exit(code)
         
     def clean_shutdown(self, signum = None, frame = None):
-        """Handle SIGINT and SIGTERM for clean shutdown"""
+        """
+        Handle SIGINT and SIGTERM for clean shutdown.
+        The handler runs on the main thread, which might be flushing
+        Data Files, so it doesn't touch files or connections: it asks
+        the main loop to stop, and run() closes them on its way out.
+        
+        Raises:
+            KeyboardInterrupt: If the main loop hasn't started yet
+        """
         if signum is not None:
             print(f"\nReceived signal {signum}")
+        if self._stop_event.is_set():
+            # Shutdown is already in progress
+            return
+        if not self.running:
+            # Interrupt the startup. run() handles it like Ctrl+C
+            raise KeyboardInterrupt
         print(f"\nShutting down...")
         self.running = False
-        DataFileSet.close_all()
-        self.connection_manager.close_all_connections()
-        self.exit(0)
+        self._stop_event.set()
+        # The main loop might be waiting for the first sample
+        self._first_sample_event.set()
+    
+    def wait_for_shutdown(self, timeout):
+        """
+        Sleep until shutdown starts or timeout expires, whichever comes first.
+        
+        Args:
+            timeout (float): Maximum time to wait, in seconds
+            
+        Returns:
+            bool: True if shutdown started, False if the timeout expired
+        """
+        return self._stop_event.wait(timeout)
     
     def load_config(self):
-        """Load and validate configuration"""
+        """Load and validate configuration.
+        If the configuration file didn't change since it was last validated,
+        the validated configuration is loaded from the cache."""
         try:
-            with open(self.config_file, 'r') as f:
-                self.config = yaml.safe_load(f)
+            with open(self.config_file, 'rb') as f:
+                raw_config = f.read()
         except FileNotFoundError:
             raise QueryVizError(f"Configuration file not found: {self.config_file}")
+        
+        config_hash = hashlib.blake2b(raw_config, digest_size=16).hexdigest()
+        cache = self._read_config_cache(config_hash)
+        if cache is not None:
+            self.config = cache['config']
+            self.config_warnings = cache['warnings']
+            for message in self.config_warnings:
+                print(message)
+            self._bind_global_settings()
+            return
+        
+        try:
+            self.config = yaml.load(raw_config, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise QueryVizError(f"Invalid YAML in configuration file: {e}")
         
         self._validate_config()
+        self._write_config_cache(config_hash)
+    
+    def _read_config_cache(self, config_hash):
+        """
+        Return the cache entry, or None if the cache is missing, unusable,
+        or was written for a different configuration file content.
+        
+        Args:
+            config_hash (str): Hash of the configuration file content
+        
+        Returns:
+            dict: The validated configuration in 'config', and the
+                validation warnings in 'warnings'
+        """
+        cache_file = self.config_file + CONFIG_CACHE_SUFFIX
+        try:
+            with open(cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if (
+                not isinstance(cache, dict) or
+                cache.get('schema') != CONFIG_CACHE_SCHEMA_VERSION or
+                cache.get('hash') != config_hash or
+                cache.get('code') != _source_fingerprint() or
+                not isinstance(cache.get('config'), dict) or
+                not isinstance(cache.get('warnings'), list)
+            ):
+            return None
+        return cache
+    
+    def _write_config_cache(self, config_hash):
+        """
+        Write the validated configuration to the cache.
+        The cache is optional: if it can't be written (for example,
+        because the configuration directory is read-only), it's skipped.
+        The cache file is only readable by its owner.
+        
+        Args:
+            config_hash (str): Hash of the configuration file content
+        """
+        cache_file = self.config_file + CONFIG_CACHE_SUFFIX
+        tmp_file = cache_file + '.tmp'
+        cache = {
+            'schema': CONFIG_CACHE_SCHEMA_VERSION,
+            'hash': config_hash,
+            'code': _source_fingerprint(),
+            'config': self.config,
+            'warnings': self.config_warnings
+        }
+        try:
+            # A leftover temporary file could have a wider mode,
+            # and O_CREAT would keep it
+            try:
+                os.remove(tmp_file)
+            except FileNotFoundError:
+                pass
+            fd = os.open(
+                tmp_file,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                CONFIG_CACHE_FILE_MODE
+            )
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            # TypeError: YAML values that JSON can't represent, like dates
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
     
     def _validate_and_parse_chart_dimensions(self, chart_config, context=""):
         """
@@ -115,7 +298,7 @@ class QueryViz:
             if not isinstance(size_str, str):
                 raise QueryVizError(f"{context}: 'chart_size' must be a string in the format '800x600'")
             
-            match = re.match(r'^(\d+)x(\d+)$', size_str.strip())
+            match = _CHART_SIZE_RE.match(size_str.strip())
             if not match:
                 raise QueryVizError(f"{context}: Invalid 'chart_size' format: '{size_str}'")
 
@@ -132,8 +315,14 @@ class QueryViz:
             if not isinstance(chart_config['chart_height'], int) or chart_config['chart_height'] <= 0:
                 raise QueryVizError(f"{context}: 'chart_height' must be a positive integer")
 
+    def _config_warning(self, message):
+        """Print a configuration warning, and keep it for the cache"""
+        print(message)
+        self.config_warnings.append(message)
+    
     def _validate_config(self):
         """Validate configuration structure and required fields"""
+        self.config_warnings = []
         if not isinstance(self.config, dict):
             raise QueryVizError("Configuration must be a dictionary")
         
@@ -146,8 +335,7 @@ class QueryViz:
             raise QueryVizError("At least one connection must be specified")
         
         for i, conn in enumerate(connections):
-            required_fields = ['name', 'dbms', 'host', 'port', 'user', 'password']
-            for field in required_fields:
+            for field in REQUIRED_CONNECTION_FIELDS:
                 if field not in conn:
                     raise QueryVizError(f"Connection {i}: '{field}' is required")
         
@@ -166,7 +354,7 @@ class QueryViz:
                 raise QueryVizError(f"Query {i}: duplicate query name '{query['name']}'")
             query_names.add(query['name'])
         
-        unused_queries = list(query_names)
+        unused_queries = set(query_names)
         
         # Validate charts configuration
         if 'charts' not in self.config:
@@ -180,8 +368,7 @@ class QueryViz:
         self._validate_and_parse_chart_dimensions(self.config, context="Global config")
         
         for i, chart in enumerate(charts):
-            required_chart_fields = ['ylabel']
-            for field in required_chart_fields:
+            for field in REQUIRED_CHART_FIELDS:
                 if field not in chart:
                     raise QueryVizError(f"Chart {i}: '{field}' is required")
             
@@ -204,7 +391,7 @@ class QueryViz:
             
             # Warning if the query list is empty
             if not chart_queries:
-                print(f"Warning: Chart {i} has an empty query list")
+                self._config_warning(f"Warning: Chart {i} has an empty query list")
 
             # Validate that all referenced queries exist and mark them as used
             # We need to handle both cases: query_ref can be a string or an object
@@ -213,8 +400,7 @@ class QueryViz:
                     # String format: validate query name exists
                     if query_ref not in query_names:
                         raise QueryVizError(f"Chart {i}, query {j}: query '{query_ref}' not found")
-                    if query_ref in unused_queries:
-                        unused_queries.remove(query_ref)
+                    unused_queries.discard(query_ref)
                         
                 elif isinstance(query_ref, dict):
                     # Object format: validate structure
@@ -241,8 +427,7 @@ class QueryViz:
                             if not isinstance(col_spec, str) or not col_spec.strip():
                                 raise QueryVizError(f"Chart {i}, query {j}, column {k}: column specification must be a non-empty string")
                     
-                    if query_name in unused_queries:
-                        unused_queries.remove(query_name)
+                    unused_queries.discard(query_name)
                         
                 else:
                     raise QueryVizError(f"Chart {i}, query {j}: query must be a string or object, got {type(query_ref).__name__}")
@@ -279,38 +464,19 @@ class QueryViz:
                 chart['key_position'] = "outside right top"
             # Set default output_file if not specified or empty
             if 'output_file' not in chart or not chart['output_file']:
-                chart['output_file'] = self.normalise_filename(chart['title'], 'png')
+                chart['output_file'] = normalise_filename(chart['title'], 'png')
         
         # Warning on unused queries
         if unused_queries:
-            print("Warning: Unused queries found:")
+            self._config_warning("Warning: Unused queries found:")
             for query_name in unused_queries:
-                print(f"  - {query_name}")
+                self._config_warning(f"  - {query_name}")
         unused_queries = None
         
-        # Validate global interval
-        if 'interval' not in self.config:
-            raise QueryVizError("Global 'interval' is required")
-        
-        # Validate failed connections interval
-        if 'failed_connections_interval' not in self.config:
-            raise QueryVizError("'failed_connections_interval' is required")
-        
-        # Validate initial grace period
-        if 'initial_grace_period' not in self.config:
-            raise QueryVizError("'initial_grace_period' is required")
-        
-        # Validate grace period retry interval
-        if 'grace_period_retry_interval' not in self.config:
-            raise QueryVizError("'grace_period_retry_interval' is required")
-            
-        # Validate once thread delay
-        if 'once_thread_delay' not in self.config:
-            raise QueryVizError("'once_thread_delay' is required")
-        
-        # Validate database connection timeout
-        if 'db_connection_timeout_seconds' not in self.config:
-            raise QueryVizError("'db_connection_timeout_seconds' is required")
+        # Validate required global settings
+        for field in REQUIRED_GLOBAL_FIELDS:
+            if field not in self.config:
+                raise QueryVizError(f"'{field}' is required")
         
         timeout = self.config['db_connection_timeout_seconds']
         if not isinstance(timeout, int) or timeout <= 0:
@@ -329,31 +495,37 @@ class QueryViz:
         for setting in interval_settings:
             self.config[setting] = Interval(setting).setget(self.config[setting])
         interval_settings = None
+        
+        self._bind_global_settings()
+    
+    def _bind_global_settings(self):
+        """Bind validated global settings to attributes"""
+        self.interval = self.config['interval']
+        self.failed_connections_interval = self.config['failed_connections_interval']
+        self.initial_grace_period = self.config['initial_grace_period']
+        self.grace_period_retry_interval = self.config['grace_period_retry_interval']
+        self.once_thread_delay = self.config['once_thread_delay']
+        self.db_connection_timeout = self.config['db_connection_timeout_seconds']
     
     def setup_connections(self):
         """Setup database connections"""
-        db_timeout = self.config['db_connection_timeout_seconds']
-        
         self.default_connection = self.connection_manager.setup_connections(
             self.config['connections'], 
-            db_timeout
+            self.db_connection_timeout
         )
     
     def test_connections(self):
         """Test all database connections before starting main loop"""
-        grace_period_retry_interval = self.config['grace_period_retry_interval']
-        initial_grace_period = self.config['initial_grace_period']
-        
         return self.connection_manager.test_connections(
-            initial_grace_period,
-            grace_period_retry_interval
+            self.initial_grace_period,
+            self.grace_period_retry_interval
         )
     
     def setup_queries(self):
         """Setup query configurations"""
         QueryConfig.set_global_int('on_rotation_keep_datapoints', self.config['on_rotation_keep_datapoints'], min=MIN_ON_ROTATION_KEEP_DATAPOINTS)
         QueryConfig.set_global_interval('on_file_rotation_keep_history', self.config['on_file_rotation_keep_history'])
-        QueryConfig.set_global_interval('interval', self.config['interval'])
+        QueryConfig.set_global_interval('interval', self.interval)
         
         for i, query_config in enumerate(self.config['queries']):
             query = QueryConfig(query_config, self.default_connection)
@@ -371,9 +543,13 @@ class QueryViz:
             data_file = DataFile(query, self.output_dir)
             self.data_files[name] = data_file
         
-        # For fast access, build a query objects lookup
+        # For fast access, build a query objects lookup,
+        # lists of queries by execution type,
         # and a pre-computed chart-to-queries map with ChartQuery objects
         self.queries_by_name = {q.name: q for q in self.queries}
+        self.data = {q.name: RingBuffer(1000) for q in self.queries}
+        self.once_queries = [q for q in self.queries if q.interval == 'once']
+        self.recurring_queries = [q for q in self.queries if q.interval != 'once']
         self.chart_queries = {}
         self.chart_generators = {}
         
@@ -428,18 +604,22 @@ class QueryViz:
             return 0
         
         rows_processed = 0
-        
+
+        # Columns are the same for every row, so we validate them
+        # and find their positions only once.
+        # Like list.index(), we use the first column with a given name.
+        column_positions = {}
+        for i, col_name in enumerate(columns):
+            column_positions.setdefault(col_name, i)
+        for col_name in query_config.columns:
+            if col_name not in column_positions:
+                raise QueryVizError(f"Column '{col_name}' not found in query results for '{query_config.name}'. Available columns: {columns}")
+        col_indices = [column_positions[col_name] for col_name in query_config.columns]
+
         for row in results:
             # Extract values for all configured columns
-            column_values = []
-            for col_name in query_config.columns:
-                if col_name not in columns:
-                    raise QueryVizError(f"Column '{col_name}' not found in query results for '{query_config.name}'. Available columns: {columns}")
-                
-                col_index = columns.index(col_name)
-                value = row[col_index]
-                column_values.append(value)
-            
+            column_values = [row[col_index] for col_index in col_indices]
+
             # Write data point to file
             data_file.write_data_point(column_values)
             rows_processed += 1
@@ -448,9 +628,7 @@ class QueryViz:
     
     def execute_once_queries_thread(self):
         """Execute all 'once' queries that haven't been run yet"""
-        once_queries = [q for q in self.queries if q.interval == 'once']
-        
-        for query_config in once_queries:
+        for query_config in self.once_queries:
             try:
                 # Skip query if connection has failed
                 if self.connection_manager.connection_has_failed(query_config.connection_name):
@@ -458,7 +636,7 @@ class QueryViz:
                     continue
                 
                 # Check if data file already exists
-                data_file = DataFileSet.is_ready(query_config.name)
+                data_file = self.data_files[query_config.name]
                 if data_file.exists():
                     print(f"Skipping 'once' query '{query_config.name}': already executed")
                     continue
@@ -471,16 +649,12 @@ class QueryViz:
                 )
                 
                 try:
-                    data_file.open()
-                    try:
-                        self.process_query_results(query_config, columns, results, data_file)
-                    except Exception as e:
-                        print(f"Error processing results for 'once' query '{query_config.name}': {e}")
-                    finally:
+                    # The Data File is closed on exit, even if processing fails
+                    with data_file:
                         try:
-                            data_file.close()
-                        except:
-                            pass
+                            self.process_query_results(query_config, columns, results, data_file)
+                        except Exception as e:
+                            print(f"Error processing results for 'once' query '{query_config.name}': {e}")
                 except Exception as e:
                     print(f"Error opening data file for 'once' query '{query_config.name}': {e}")
                     
@@ -489,87 +663,113 @@ class QueryViz:
         
         print("Finished executing 'once' queries")
     
-    def execute_query_thread(self, query_config):
-        """Execute a single query in a loop"""
-        data_file = DataFileSet.is_ready(query_config.name)
-        
-        if (
-                query_config.time_type == 'elapsed_seconds' and
-                query_config.start_time is None
-            ):
-            query_config.start_time = int(time.time())
+    def schedule_recurring_queries(self):
+        """
+        Run recurring queries at their intervals.
+        A single thread keeps the queries in a priority queue ordered by
+        their next run time, and hands them over to a pool of workers.
+        """
+        if not self.recurring_queries:
+            return
+        
+        # Samplers and connections never change, so we prepare them once
+        samplers = {}
+        connections = {}
+        for query_config in self.recurring_queries:
+            if (
+                    query_config.time_type == 'elapsed_seconds' and
+                    query_config.start_time is None
+                ):
+                query_config.start_time = int(time.time())
+            
+            # The connection object never changes, only its status does
+            connection = self.connection_manager.get_connection(query_config.connection_name)
+            connections[query_config.name] = connection
+            samplers[query_config.name] = query_config.build_sampler(
+                connection,
+                self.data[query_config.name],
+                self.timestamps,
+                self.data_files[query_config.name]
+            )
         
-        while self.running:
-            try:
-                # Skip query if connection has failed
-                if self.connection_manager.connection_has_failed(query_config.connection_name):
-                    time.sleep(query_config.interval)
-                    continue
-                
-                start_time = time.time()
-                columns, results = self.connection_manager.execute_query(
-                    query_config.connection_name,
-                    query_config.query
-                )
-                
-                if not results:
-                    print(f"Warning: Query '{query_config.name}' returned no results")
-                    time.sleep(query_config.interval)
+        # Items are (next_run_time, position, query_config).
+        # position breaks ties, so QueryConfig objects are never compared
+        now = time.monotonic()
+        schedule = [(now, i, query_config) for i, query_config in enumerate(self.recurring_queries)]
+        heapq.heapify(schedule)
+        # A query is not started again while its previous execution is running
+        running = {}
+        
+        # One worker per query. A query is never started twice at the same
+        # time, so a slow query never delays the others, even when they
+        # use the same connection.
+        # Workers are daemon threads, so queries that are still running
+        # don't block the exit
+        pool = WorkerPool(len(self.recurring_queries), name='query')
+        try:
+            while self.running:
+                next_run_time, i, query_config = schedule[0]
+                wait_time = next_run_time - time.monotonic()
+                if wait_time > 0:
+                    if self._stop_event.wait(wait_time):
+                        break
                     continue
                 
-                # Extract values for all configured columns
-                column_values = []
-                for col_name in query_config.columns:
-                    if col_name not in columns:
-                        raise QueryVizError(f"Column '{col_name}' not found in query results for '{query_config.name}'. Available columns: {columns}")
-                    
-                    col_index = columns.index(col_name)
-                    value = results[0][col_index]
-                    column_values.append(value)
-                
-                # Store data point and write to file incrementally
-                current_time = time.time()
+                name = query_config.name
+                done = running.get(name)
+                if done is None or done.is_set():
+                    running[name] = pool.submit(
+                        self.execute_recurring_query,
+                        query_config,
+                        connections[name],
+                        samplers[name]
+                    )
                 
-                with self.data_lock:
-                    # "time" is not a metric
-                    if query_config.columns[0] == 'time':
-                        metric_value = column_values[1]
-                    else:
-                        metric_value = column_values[0]
-                    
-                    # Convert to numeric and store
-                    try:
-                        numeric_value = float(metric_value)
-                        self.data[query_config.name].append(numeric_value)
-                    except (ValueError, TypeError):
-                        raise QueryVizError(f"Metric value '{metric_value}' from query '{query_config.name}' is not numeric")
-                    
-                    # Update timestamps (shared across all queries)
-                    if len(self.timestamps) == 0 or current_time > self.timestamps[-1]:
-                        self.timestamps.append(current_time)
-                    
-                    # Write data point to file
-                    data_file.write_data_point(column_values)
-                
-                print(f"Query '{query_config.name}': {column_values}")
-                
-                # Sleep for remaining interval time
-                elapsed = time.time() - start_time
-                sleep_time = max(0, query_config.interval - elapsed)
-                time.sleep(sleep_time)
-                
-            except Exception as e:
-                print(f"Error executing query '{query_config.name}': {e}")
-                time.sleep(query_config.interval)
+                # If we're late, don't try to catch up with missed runs
+                now = time.monotonic()
+                next_run_time = max(next_run_time + query_config.interval, now)
+                heapq.heapreplace(schedule, (next_run_time, i, query_config))
+        finally:
+            pool.shutdown()
+    
+    def execute_recurring_query(self, query_config, connection, sample):
+        """
+        Execute a recurring query once
+        
+        Args:
+            query_config: QueryConfig object
+            connection: DatabaseConnection used by the query
+            sample: Function built by QueryConfig.build_sampler()
+        """
+        try:
+            # Skip query if connection has failed
+            if connection.status == FAIL:
+                return
+            
+            column_values = sample()
+            
+            if column_values is None:
+                print(f"Warning: Query '{query_config.name}' returned no results")
+                return
+            
+            print(f"Query '{query_config.name}': {column_values}")
+            if not self._first_sample_event.is_set():
+                self._first_sample_event.set()
+            
+        except Exception as e:
+            print(f"Error executing query '{query_config.name}': {e}")
     
     def create_chart_index(self, chart_filenames):
         """Write the chart index file with all generated chart filenames"""
         index_file = os.path.join(self.output_dir, '_CHART_INDEX')
-        
+        # Write to a temporary file and rename it, so readers never see
+        # a partially written index
+        tmp_file = index_file + '.tmp'
+
         try:
-            with open(index_file, 'w') as f:
-                for filename in chart_filenames:
-                    f.write(f"{filename}\n")
+            with open(tmp_file, 'w') as f:
+                f.write(''.join(f"{filename}\n" for filename in chart_filenames))
+            os.replace(tmp_file, index_file)
             print(f"Chart index written: {index_file}")
         except Exception as e:
             print(f"Error writing chart index: {e}")
@@ -578,13 +778,14 @@ class QueryViz:
         """Generate all plots using chart generators"""
         chart_filenames = []
         
+        # Gnuplot reads the Data Files, so buffered data points must be written first
+        DataFileSet.flush_all()
+        
         for chart_index, chart_generator in self.chart_generators.items():
             chart_queries = self.chart_queries[chart_index]
             
             if chart_generator.generate_all_charts(chart_queries):
-                # Get the output filename from the chart config
-                chart_config = self.config['charts'][chart_index]
-                chart_filenames.append(chart_config['output_file'])
+                chart_filenames.append(chart_generator.plot_config['output_file'])
         
         self.create_chart_index(chart_filenames)
     
@@ -605,6 +806,7 @@ class QueryViz:
             
             self.setup_queries()
             
+            os.makedirs(self.output_dir, exist_ok=True)
             for query in self.queries:
                 DataFileSet.set(query, self.output_dir)
             
@@ -614,24 +816,19 @@ class QueryViz:
             self.running = True
             
             # Start once queries thread (if any exist)
-            once_queries = [q for q in self.queries if q.interval == 'once']
             once_thread_should_start = True
-            if once_queries:
-                print(f"The Once Thread will start for {len(once_queries)} queries")
+            if self.once_queries:
+                print(f"The Once Thread will start for {len(self.once_queries)} queries")
             else:
                 once_thread_should_start = False
                 print("The Once Thread will not start because there are no Once Queries to run")
             
-            # Start query threads
-            started_threads = 0
-            for query in self.queries:
-                if query.interval != 'once':
-                    thread = threading.Thread(target=self.execute_query_thread, args=(query,))
-                    thread.daemon = True
-                    thread.start()
-                    self.threads.append(thread)
-                    started_threads = started_threads + 1
-            print(f"Started {started_threads} query threads")
+            # Start the thread that schedules recurring queries
+            scheduler_thread = threading.Thread(target=self.schedule_recurring_queries)
+            scheduler_thread.daemon = True
+            scheduler_thread.start()
+            self.threads.append(scheduler_thread)
+            print(f"Started query scheduler for {len(self.recurring_queries)} recurring queries")
             
             # Start failed connection retry thread
             retry_thread = self.connection_manager.start_connection_retry_thread(self.config, self)
@@ -648,7 +845,7 @@ class QueryViz:
                 current_time = time.time()
                 
                 if once_thread_should_start:
-                    if (current_time - pre_loop_time) >= self.config['once_thread_delay']:
+                    if (current_time - pre_loop_time) >= self.once_thread_delay:
                         once_thread = threading.Thread(target=self.execute_once_queries_thread)
                         once_thread.daemon = False
                         once_thread.start()
@@ -660,7 +857,23 @@ class QueryViz:
                     self.generate_plots()
                     last_plot_time = current_time
                 
-                time.sleep(1)
+                # Sleep until the next plot is due or the Once Thread must start.
+                # If there was no data to plot, also wake up when the first
+                # sample arrives, so the first charts are drawn immediately.
+                next_wakeup_time = last_plot_time + plot_interval
+                if next_wakeup_time <= current_time:
+                    next_wakeup_time = current_time + plot_interval
+                if once_thread_should_start:
+                    next_wakeup_time = min(next_wakeup_time, pre_loop_time + self.once_thread_delay)
+                
+                timeout = max(0, next_wakeup_time - time.time())
+                if self.timestamps:
+                    if self._stop_event.wait(timeout):
+                        break
+                else:
+                    self._first_sample_event.wait(timeout)
+                    if self._stop_event.is_set():
+                        break
                 
         except KeyboardInterrupt:
             print("\nShutting down...")
@@ -669,6 +882,7 @@ class QueryViz:
             self.exit(1)
         finally:
             self.running = False
+            self._stop_event.set()
             DataFileSet.close_all()
             self.connection_manager.close_all_connections()
         
@@ -5,11 +5,21 @@ A data file must contain data from one query.
 """
 
 import os
-import re
 import time
 from collections import deque
-from threading import Lock
+from threading import Lock, RLock
 from .temporal_column import TemporalColumnRegistry
+from .filename import normalise_filename
+
+
+# Data Files can grow beyond on_rotation_keep_datapoints by this fraction
+# before they're rotated. Without this margin, once the limit is reached
+# every new data point would cause a full rewrite of the file.
+ROTATION_HEADROOM_RATIO = 0.5
+
+# Data Files are opened in binary mode, to skip the text layer.
+# Lines are encoded once, when they're formatted, and kept in memory as bytes
+DATA_FILE_ENCODING = 'utf-8'
 
 
 class DataFile:
@@ -20,12 +30,45 @@ class DataFile:
     # Govern instance creation
     _lock = Lock()
     
+    # Instances have a fixed set of attributes, so they don't need a __dict__
+    __slots__ = (
+          '_initialized'
+        , 'query_name'
+        , 'query_description'
+        , 'query_interval'
+        , 'columns'
+        , 'output_dir'
+        , 'max_points'
+        , 'rotation_threshold'
+        , 'has_time_column'
+        , 'time_type'
+        , 'on_file_rotation_keep_history'
+        , 'temporal_column'
+        , '_format_time'
+        , '_generate_artificial_time'
+        , 'filename'
+        , 'filepath'
+        , '_header_bytes'
+        , '_file_handle'
+        , '_file_lock'
+        , '_point_count'
+        , '_is_open'
+        , '_pending_lines'
+        , '_data_lines'
+    )
+    
     def __new__(cls, query_object, output_dir):
         """
         Ensure only one DataFile instance per query_name.
         """
         key = query_object.get_setting("name")
         
+        # Existing instances are returned without taking the lock.
+        # Instances are never replaced, so a dict lookup is safe
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+        
         with cls._lock:
             if key not in cls._instances:
                 instance = super().__new__(cls)
@@ -52,6 +95,7 @@ class DataFile:
         self.columns = query_object.get_setting("columns")
         self.output_dir = query_object.get_setting("output_dir", '')
         self.max_points = query_object.get_setting("on_rotation_keep_datapoints")
+        self.rotation_threshold = self.max_points + max(1, int(self.max_points * ROTATION_HEADROOM_RATIO))
         self.has_time_column = (self.columns[0] == 'time')
         self.time_type = query_object.get_setting("time_type")
         self.on_file_rotation_keep_history = query_object.get_setting("on_file_rotation_keep_history", False)
@@ -61,42 +105,46 @@ class DataFile:
         # Link temporal_column.start_time to query_object.start_time
         if self.time_type == 'elapsed_seconds':
             self.temporal_column.get_start_time = lambda: query_object.get_setting('start_time', None)
+        # Bound once, because they're called for every data point
+        self._format_time = self.temporal_column.format_value
+        self._generate_artificial_time = self.temporal_column.generate_artificial_time
         
         # Normalize query name for filename
         self.filename = self._generate_filename(self.query_name)
         self.filepath = os.path.join(output_dir, self.filename)
+        self._header_bytes = self._build_headers()
         
         # File handle and tracking
         self._file_handle = None
+        # Data points are written by the query thread, but the main thread
+        # flushes the file. This lock only protects this file's handle.
+        # It's reentrant, so the thread that is flushing the file can also
+        # close it
+        self._file_lock = RLock()
         self._point_count = 0
         self._is_open = False
+        # Encoded lines not yet written to the file.
+        # They're written in one call when the file is flushed
+        self._pending_lines = []
         
         # In-memory data for rotation (no locks needed - single thread per instance)
-        # File lines are stored as a list of strings
+        # File lines are stored as encoded bytes, shared with _pending_lines
         self._data_lines = deque(maxlen=self.max_points)
         
         self._initialized = True
     
     def _generate_filename(self, query_name):
         """Generate normalized filename from query name"""
-        # Remove special characters (keep only alphanumeric, spaces, underscores, and hyphens)
-        normalized = re.sub(r'[^a-zA-Z0-9\s_-]', '', query_name)
-        # Convert spaces and underscores to dashes
-        normalized = re.sub(r'[\s_]+', '-', normalized)
-        # Collapse consecutive dashes into one dash
-        normalized = re.sub(r'-+', '-', normalized)
-        # Remove leading/trailing dashes
-        normalized = normalized.strip('-')
-        # Make lowercase
-        normalized = normalized.lower()
-        # Add extension
-        return f"{normalized}.dat"
+        return normalise_filename(query_name, 'dat')
     
-    def _write_headers(self):
-        """Write header comments to the data file"""
-        if not self._file_handle:
-            raise RuntimeError(f"DataFile for '{self.query_name}' is not open")
+    def _build_headers(self):
+        """
+        Build the header comments of the data file.
+        They only depend on the query settings, so they're built once.
         
+        Returns:
+            bytes: Encoded header comments
+        """
         # Build column list string
         if self.has_time_column:
             columns_str = ', '.join(self.columns)
@@ -117,7 +165,14 @@ class DataFile:
 # Columns: {columns_str}
 #
 """
-        self._file_handle.write(header)
+        return header.encode(DATA_FILE_ENCODING)
+    
+    def _write_headers(self):
+        """Write header comments to the data file"""
+        if not self._file_handle:
+            raise RuntimeError(f"DataFile for '{self.query_name}' is not open")
+        
+        self._file_handle.write(self._header_bytes)
     
     def _format_data_line(self, values):
         """
@@ -129,40 +184,38 @@ class DataFile:
         Returns:
             str: Formatted line ready for file writing
         """
+        # This runs for every data point, so a single list is built
+        # and joined, without intermediate lists
         if self.has_time_column:
             # A Temporal Column is in the query results
             # We format it according to its type
-            time_value = values[0]
-            formatted_time = self.temporal_column.format_value(time_value)
-            other_values = [str(val) for val in values[1:]]
-            line_values = [formatted_time] + other_values
-        else:
-            # The query has no Temporal Column
-            # Let's generate a Temporal Value artificially
-            artificial_time = self.temporal_column.generate_artificial_time(self._point_count, self.query_interval)
-            line_values = [artificial_time] + [str(val) for val in values]
+            formatted_time = self._format_time(values[0])
+            return ' '.join([formatted_time, *map(str, values[1:])]) + '\n'
         
-        return ' '.join(line_values) + '\n'
+        # The query has no Temporal Column
+        # Let's generate a Temporal Value artificially
+        artificial_time = self._generate_artificial_time(self._point_count, self.query_interval)
+        return ' '.join([artificial_time, *map(str, values)]) + '\n'
     
     def _parse_timestamp_from_line(self, line):
         """
         Parse timestamp from a data line.
         
         Args:
-            line (str): Data line from cache
+            line (bytes): Encoded data line from cache
             
         Returns:
             float: Parsed timestamp, or None if parsing fails
         """
-        # Split line and get first column (timestamp)
-        parts = line.strip().split()
-        if not parts:
-            return None
-            
+        # Lines are written by _format_data_line(), so the timestamp
+        # is everything before the first space. No need to split the
+        # whole line
+        timestamp_str = line.partition(b' ')[0]
+        
         try:
             # Convert timestamp string to float for comparison
-            return float(int(parts[0]))
-        except (ValueError, IndexError):
+            return float(int(timestamp_str))
+        except ValueError:
             # TODO: Handle timestamp parsing failures properly
             # For now, return None to indicate parsing failure
             return None
@@ -172,30 +225,49 @@ class DataFile:
         return os.path.exists(self.get_filepath())
     
     def open(self):
-        """Open data file for writing, removing existing file if it exists"""
+        """Open data file for writing, truncating existing file if it exists"""
         if self._is_open:
             return
         
-        # Remove existing file and start fresh
-        if os.path.exists(self.filepath):
-            os.remove(self.filepath)
-        
-        self._file_handle = open(self.filepath, 'w')
+        # Truncate existing file and start fresh
+        self._file_handle = open(self.filepath, 'wb')
         self._write_headers()
         self._point_count = 0
+        self._pending_lines.clear()
         self._data_lines.clear()
         self._is_open = True
     
     def close(self):
         """Close data file"""
-        if self._file_handle:
-            self._file_handle.close()
-            self._file_handle = None
-        self._is_open = False
+        with self._file_lock:
+            if self._file_handle:
+                self._write_pending_lines()
+                self._file_handle.close()
+                self._file_handle = None
+            self._is_open = False
+    
+    def flush(self):
+        """Write buffered data points to disk"""
+        with self._file_lock:
+            if self._file_handle:
+                self._write_pending_lines()
+            # The file might have been closed while pending lines were written
+            if self._file_handle:
+                self._file_handle.flush()
+    
+    def _write_pending_lines(self):
+        """Write all pending lines with a single call. The caller must hold _file_lock"""
+        if self._pending_lines:
+            # Lines are taken before writing them, so a nested close()
+            # doesn't write them twice
+            data = b''.join(self._pending_lines)
+            self._pending_lines.clear()
+            self._file_handle.write(data)
     
     def write_data_point(self, values):
         """
         Write a data point to the file.
+        The line is kept in memory until the file is flushed or closed.
         
         Args:
             values (list): List of values for all columns
@@ -206,21 +278,22 @@ class DataFile:
         if not self._is_open or not self._file_handle:
             raise RuntimeError(f"DataFile for '{self.query_name}' is not open")
         
-        # Format the line
-        formatted_line = self._format_data_line(values)
-        
-        # Write to file
-        self._file_handle.write(formatted_line)
-        self._file_handle.flush()  # Ensure data is written immediately
+        # Format and encode the line
+        formatted_line = self._format_data_line(values).encode(DATA_FILE_ENCODING)
         
-        # Store in memory for rotation
-        self._data_lines.append(formatted_line)
-        self._point_count += 1
-        
-        # Check if rotation is needed
-        if self._point_count > self.max_points:
-            self._rotate_file()
-            return True
+        with self._file_lock:
+            # Write to file. The data is buffered, it will be flushed
+            # before charts are generated
+            self._pending_lines.append(formatted_line)
+            
+            # Store in memory for rotation
+            self._data_lines.append(formatted_line)
+            self._point_count += 1
+            
+            # Check if rotation is needed
+            if self._point_count > self.rotation_threshold:
+                self._rotate_file()
+                return True
         
         return False
     
@@ -246,20 +319,22 @@ class DataFile:
             while len(self._data_lines) > self.max_points:
                 self._data_lines.popleft()
         
-        # Close Data File, then rewrite the headers and the remaining data
+        # Close Data File, then write the headers and the remaining data
+        # to a temporary file that replaces it. This way, readers never
+        # see a truncated Data File.
+        # Pending lines are also in _data_lines, so they're written here
 
         if self._file_handle:
             self._file_handle.close()
 
-        self._file_handle = open(self.filepath, 'w')
-        self._write_headers()
-
-        for line in self._data_lines:
-            self._file_handle.write(line)
-        
-        # Close and reopen file for appending
-        self._file_handle.close()
-        self._file_handle = open(self.filepath, 'a')
+        tmp_filepath = self.filepath + '.tmp'
+        self._file_handle = open(tmp_filepath, 'wb')
+        self._file_handle.write(b''.join([self._header_bytes, *self._data_lines]))
+        self._pending_lines.clear()
+        self._file_handle.flush()
+        # The handle is not reopened: after the rename it refers to the
+        # new Data File, and it's positioned at its end, ready to append
+        os.replace(tmp_filepath, self.filepath)
         
         # Update point count
         self._point_count = len(self._data_lines)
@@ -287,7 +362,7 @@ class DataFile:
                 return ['time'] + self.columns.copy()
         
         try:
-            with open(self.filepath, 'r') as f:
+            with open(self.filepath, 'r', encoding=DATA_FILE_ENCODING) as f:
                 for line in f:
                     line = line.strip()
                     if line.startswith('# Columns:'):
@@ -318,7 +393,7 @@ class DataFile:
     
     def get_data_copy(self):
         """Get a copy of the current in-memory data"""
-        return list(self._data_lines)
+        return [line.decode(DATA_FILE_ENCODING) for line in self._data_lines]
     
     @classmethod
     def clear_instances(cls):
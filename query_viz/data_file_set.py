@@ -9,6 +9,8 @@ class DataFileSet:
     """Manages all DataFile instances. Only class methods - do not instantiate."""
     
     _data_files = {}
+    # Subset of _data_files, for queries with intervals (not 'once')
+    _recurring_data_files = {}
 
     def __new__(cls, *args, **kwargs):
         """Prevent instantiation of DataFileSet"""
@@ -19,12 +21,14 @@ class DataFileSet:
         """Create a DataFile instance and cache it"""
         data_file = DataFile(query_object, output_dir)
         cls._data_files[query_object.name] = data_file
+        if data_file.query_interval != 'once':
+            cls._recurring_data_files[query_object.name] = data_file
     
     @classmethod
     def has_started(cls, query_name):
         """Returns whether the DataFile exists and writing has started at least once.
-        However, it might be currently empty: during rotation, the Data File's content
-        is entirely replaced, so for a brief period of time it is empty."""
+        Rotation replaces the Data File atomically, so readers never see it empty
+        once writing has started."""
         data_file = cls._data_files.get(query_name)
         if data_file is not None:
             return data_file.get_point_count() > 0
@@ -50,9 +54,15 @@ class DataFileSet:
     @classmethod
     def open_recurring_queries(cls):
         """Open data files for queries with intervals (not 'once')"""
+        for data_file in cls._recurring_data_files.values():
+            data_file.open()
+    
+    @classmethod
+    def flush_all(cls):
+        """Write buffered data of all open data files to disk"""
         for data_file in cls._data_files.values():
-            if data_file.query_interval != 'once':
-                data_file.open()
+            if data_file.is_open():
+                data_file.flush()
     
     @classmethod
     def close_all(cls):
@@ -65,3 +75,4 @@ class DataFileSet:
     def clear_all(cls):
         """Clear all cached DataFile instances (for testing)"""
         cls._data_files.clear()
+        cls._recurring_data_files.clear()
@@ -4,6 +4,7 @@ Base database connection class
 
 import re
 import ipaddress
+from functools import lru_cache
 
 from abc import ABC, abstractmethod
 from ..exceptions import QueryVizError
@@ -13,6 +14,14 @@ from ..exceptions import QueryVizError
 SUCCESS = "SUCCESS"
 FAIL = "FAIL"
 
+# A hostname: up to 253 characters, made of dot-separated labels like "db-1".
+# Each label has up to 63 characters, and can't start or end with a dash
+_HOSTNAME_RE = re.compile(
+    r'\A(?=.{1,253}\Z)'
+    r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'
+    r'(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*\Z'
+)
+
 
 class DatabaseConnection(ABC):
     """Abstract class for database connections"""
@@ -44,6 +53,8 @@ class DatabaseConnection(ABC):
         # When True, a connection is supposed to be open but it's not guaranteed.
         # When False, no connection is open or the Connector doesn't update this variable.
         self.maybe_connected = False
+        # Error raised by the last failed connection attempt made by try_connect()
+        self.last_error = None
     
     def _set_defaults(self, config):
         """
@@ -183,6 +194,9 @@ class DatabaseConnection(ABC):
     
     @classmethod
     def _is_valid_port(cls, port):
+        # Ports from YAML are normally ints, and need no conversion
+        if type(port) is int:
+            return 1 <= port <= 65535
         try:
             port_int = int(port)
             return 1 <= port_int <= 65535
@@ -190,6 +204,7 @@ class DatabaseConnection(ABC):
             return False
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def _is_valid_host(cls, host, allow_port=True):
         """
         Validates host. host can be a hostname (even multi-part),
@@ -200,6 +215,7 @@ class DatabaseConnection(ABC):
         When not specified, port_part is None.
         When the host is not valid, host_part and port_part might be None
         even when specified.
+        The result only depends on the arguments, so it is cached.
         """
         if not host:
             return (False, None, None)
@@ -216,11 +232,9 @@ class DatabaseConnection(ABC):
                 host_part = host[1:bracket_end]
                 port_part = host[bracket_end + 2:]
             else:
-                # IPv4 or hostname with port
-                parts = host.rsplit(':', 1)
-                if len(parts) != 2:
-                    return (False, host_part, port_part)
-                host_part, port_part = parts
+                # IPv4 or hostname with port.
+                # We know that host contains ':', so there are always 2 parts
+                host_part, _, port_part = host.rpartition(':')
             
             # Validate port
             if not cls._is_valid_port(port_part):
@@ -228,38 +242,31 @@ class DatabaseConnection(ABC):
         else:
             host_part = host
 
-        # Try hostname first
-        if cls._is_valid_hostname(host_part):
-            return (True, host_part, port_part)
-        
-        # Try IPv4
-        try:
-            ipaddress.IPv4Address(host_part)
-            return (True, host_part, port_part)
-        except:
-            pass
-        
-        # Try IPv6
-        try:
-            ipaddress.IPv6Address(host_part)
+        # Only try the parser that matches the shape of host_part.
+        # Digits and dots can only form an IPv4 address: the hostname
+        # check would also accept invalid addresses like 999.999.999.999
+        if ':' in host_part:
+            try:
+                ipaddress.IPv6Address(host_part)
+                return (True, host_part, port_part)
+            except ValueError:
+                pass
+        elif host_part.replace('.', '').isdigit():
+            try:
+                ipaddress.IPv4Address(host_part)
+                return (True, host_part, port_part)
+            except ValueError:
+                pass
+        elif cls._is_valid_hostname(host_part):
             return (True, host_part, port_part)
-        except:
-            pass
         
         return (False, host_part, port_part)
     
     @classmethod
     def _is_valid_hostname(cls, hostname):
-        if not hostname or len(hostname) > 253:
+        if not hostname:
             return False
-       
-        labels = hostname.split('.')
-        for label in labels:
-            if not label or len(label) > 63:
-                return False
-            if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$', label):
-                return False
-        return True
+        return _HOSTNAME_RE.match(hostname) is not None
     
     @classmethod
     def validate_config(cls, config):
@@ -291,6 +298,24 @@ class DatabaseConnection(ABC):
         else:
             raise QueryVizError(message)
     
+    def try_connect(self):
+        """
+        Call connect(), but report failures via the return value and status
+        instead of raising. Useful for callers that probe many connections.
+        
+        Returns:
+            bool: True if the connection succeeded, False otherwise.
+                  On failure, the error is stored in last_error.
+        """
+        try:
+            self.connect()
+        except QueryVizError as e:
+            self.status = FAIL
+            self.last_error = e
+            return False
+        self.last_error = None
+        return self.status != FAIL
+    
     @abstractmethod
     def connect(self):
         """Establish database connection"""
@@ -27,7 +27,10 @@ class MariaDBConnection(DatabaseConnection):
         'host': 'localhost',
         'port': 3306,
         'user': None,
-        'password': None
+        'password': None,
+        # Each running query takes one pooled connection, so this
+        # should be at least the number of queries using the connection
+        'pool_size': 5
     }
     
     # Enable multi-host support for failover
@@ -61,24 +64,30 @@ class MariaDBConnection(DatabaseConnection):
         port = config['port']
         if not isinstance(port, int) or port <= 0 or port > 65535:
             cls.validationError(connection_name, "'port' must be a valid port number (1-65535)")
+        
+        # Optional, defaults are applied later
+        if 'pool_size' in config:
+            pool_size = config['pool_size']
+            if not isinstance(pool_size, int) or pool_size <= 0:
+                cls.validationError(connection_name, "'pool_size' must be a positive integer")
     
     def connect(self):
         """Create connection pool"""
         try:
             self.pool = mariadb.ConnectionPool(
                 pool_name='pool_' + self.config['name'],
-                pool_size=5,
+                pool_size=self.config['pool_size'],
                 host=self.config['host'],
                 port=self.config['port'],
                 user=self.config['user'],
                 password=self.config['password'],
                 connect_timeout=self.db_timeout
             )
-            print("[mariadb] Created connection pool to " + self.config['host'] + ":" + str(self.config['port']))
+            print(f"[mariadb] Created connection pool to {self.config['host']}:{self.config['port']}")
             self.status = SUCCESS
         except mariadb.Error as e:
             self.status = FAIL
-            raise QueryVizError("[mariadb] Failed to create connection pool for " + self.config['host'] + ": " + str(e))
+            raise QueryVizError(f"[mariadb] Failed to create connection pool for {self.config['host']}: {str(e)}")
     
     def execute_query(self, query):
         """Get connection from pool, execute query, return connection"""
@@ -94,7 +103,7 @@ class MariaDBConnection(DatabaseConnection):
             cursor.close()
             return columns, results
         except mariadb.Error as e:
-            raise QueryVizError("[mariadb] Query execution failed on " + self.config['name'] + ": " + str(e))
+            raise QueryVizError(f"[mariadb] Query execution failed on {self.config['name']}: {str(e)}")
         finally:
             # Return connection to pool
             connection.close()
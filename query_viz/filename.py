@@ -0,0 +1,30 @@
+"""
+Filename normalisation, shared by Data Files and charts
+"""
+
+import string
+from functools import lru_cache
+
+
+# Characters kept as they are when normalising filenames
+_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits)
+
+
+@lru_cache(maxsize=512)
+def normalise_filename(basename, extension=None):
+    """Normalise a filename by removing special characters and standardising format.
+    The result only depends on the arguments, so it is cached."""
+    chars = []
+    for c in basename:
+        # Only keep alphanumeric, spaces, underscores, hyphens
+        if c in _FILENAME_CHARS:
+            chars.append(c)
+        # Convert spaces and underscores to dashes, and collapse
+        # consecutive dashes into one dash. Leading dashes are skipped
+        elif c == '-' or c == '_' or c.isspace():
+            if chars and chars[-1] != '-':
+                chars.append('-')
+    normalised = ''.join(chars).rstrip('-').lower()
+    if extension:
+        return f"{normalised}.{extension}"
+    return normalised
@@ -3,9 +3,14 @@ Interval parsing and validation implementation
 """
 
 import re
+from functools import lru_cache
 from ..exceptions import QueryVizError
 
 
+# A number followed by an optional unit, without whitespace
+_INTERVAL_RE = re.compile(r'^([0-9]*\.?[0-9]+)([a-zA-Z]?)$')
+
+
 class Interval:
     """Parse and validate time intervals with support for special values"""
     
@@ -76,9 +81,6 @@ class Interval:
         """
         if interval_str is None:
             raise QueryVizError("Interval cannot be None")
-        interval_str = str(interval_str).strip()
-        if not interval_str:
-            raise QueryVizError("Interval cannot be empty")
         
         # Get validation rules based on interval_type
         validation_rules = self.INTERVAL_TYPES[self.interval_type]
@@ -86,19 +88,26 @@ class Interval:
         max_seconds = validation_rules['max']
         special_values = validation_rules['special_values']
         
-        # Check for special values first (case-insensitive)
-        normalized_input = interval_str.lower()
-        if normalized_input in special_values:
-            self._value = normalized_input
-            self._is_special = True
-            return True
-        
-        # Parse numeric interval
-        try:
+        # Numbers are already in seconds, so there is nothing to parse.
+        # This is the common case for values that were already validated
+        if type(interval_str) is int or type(interval_str) is float:
+            self._value = float(interval_str)
+            self._is_special = False
+        else:
+            interval_str = str(interval_str).strip()
+            if not interval_str:
+                raise QueryVizError("Interval cannot be empty")
+            
+            # Check for special values first (case-insensitive)
+            normalized_input = interval_str.lower()
+            if normalized_input in special_values:
+                self._value = normalized_input
+                self._is_special = True
+                return True
+            
+            # Parse numeric interval
             self._value = self._parse_numeric_interval(interval_str)
             self._is_special = False
-        except QueryVizError:
-            raise
         
         # Verify that value is in range
         if min_seconds is not None and self._value < min_seconds:
@@ -106,9 +115,12 @@ class Interval:
         if max_seconds is not None and self._value > max_seconds:
             raise QueryVizError(f"Interval is too high. Max: {max_seconds}")
     
-    def _parse_numeric_interval(self, interval_str):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _parse_numeric_interval(interval_str):
         """
-        Parse numeric interval string to seconds
+        Parse numeric interval string to seconds.
+        The same few strings are parsed for every query, so results are cached
         
         Args:
             interval_str: String like '1m', '30s', '2.5h'
@@ -120,7 +132,7 @@ class Interval:
             QueryVizError: If format is invalid
         """
         # Remove all whitespace characters
-        clean_str = re.sub(r'\s+', '', interval_str)
+        clean_str = ''.join(interval_str.split())
         
         # Check if it's just a number (default to seconds)
         try:
@@ -129,20 +141,18 @@ class Interval:
             pass
         
         # Extract numeric part and unit
-        match = re.match(r'^([0-9]*\.?[0-9]+)([a-zA-Z]?)$', clean_str)
+        match = _INTERVAL_RE.match(clean_str)
         if not match:
             raise QueryVizError(f"Invalid interval format: {interval_str}")
         
         value_str, unit = match.groups()
         value = float(value_str)
-        if not unit:
-            unit = 's'
-        else:
-            unit = unit.lower()
-        if unit not in self.UNITS:
+        unit = unit.lower() or 's'
+        multiplier = Interval.UNITS.get(unit)
+        if multiplier is None:
             raise QueryVizError(f"Invalid time unit '{unit}' in interval: {interval_str}")
         
-        return value * self.UNITS[unit]
+        return value * multiplier
     
     def get_seconds(self):
         """
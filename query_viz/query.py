@@ -3,6 +3,8 @@ Query configuration
 """
 
 
+import time
+
 from .exceptions import QueryVizError
 from .interval import Interval
 from .temporal_column import TemporalColumnRegistry
@@ -254,6 +256,94 @@ class QueryConfig:
         """Get number of metric columns"""
         return len(self.get_metrics())
     
+    def build_sampler(self, connection, data, timestamps, data_file):
+        """
+        Build a function that runs this query once and stores the result.
+        Everything that can't change between executions is decided here,
+        so the returned function doesn't need to check it again.
+        
+        Args:
+            connection: DatabaseConnection used to run the query
+            data (RingBuffer): Where numeric metric values are appended.
+                               Only the returned function must append to it,
+                               and it must not be called concurrently
+            timestamps (deque): Sample times, shared across all queries.
+                                It must have a maxlen
+            data_file: DataFile where data points are written
+            
+        Returns:
+            callable: Function with no arguments, that returns the values
+                      of the configured columns, or None if the query
+                      returned no results
+        """
+        name = self.name
+        query = self.query
+        configured_columns = tuple(self.columns)
+        execute_query = connection.execute_query
+        append_value = data.append
+        append_timestamp = timestamps.append
+        write_data_point = data_file.write_data_point
+        get_time = time.time
+        # "time" is not a metric
+        metric_idx = 1 if configured_columns[0] == 'time' else 0
+        
+        # The query returns the same columns every time, so their positions
+        # are only computed again if the result columns change
+        known_columns = None
+        col_indices = ()
+        
+        def sample():
+            nonlocal known_columns, col_indices
+            
+            columns, results = execute_query(query)
+            if not results:
+                return None
+            
+            if columns != known_columns:
+                column_positions = {}
+                for i, col_name in enumerate(columns):
+                    column_positions.setdefault(col_name, i)
+                for col_name in configured_columns:
+                    if col_name not in column_positions:
+                        raise QueryVizError(f"Column '{col_name}' not found in query results for '{name}'. Available columns: {columns}")
+                col_indices = tuple(column_positions[col_name] for col_name in configured_columns)
+                known_columns = columns
+            
+            # Extract values for all configured columns
+            row = results[0]
+            column_values = [row[col_index] for col_index in col_indices]
+            
+            # Convert to numeric.
+            # Drivers normally return floats or ints, so we handle them
+            # without going through the generic conversion.
+            metric_value = column_values[metric_idx]
+            metric_type = type(metric_value)
+            if metric_type is float:
+                numeric_value = metric_value
+            elif metric_type is int:
+                numeric_value = float(metric_value)
+            else:
+                try:
+                    numeric_value = float(metric_value)
+                except (ValueError, TypeError):
+                    raise QueryVizError(f"Metric value '{metric_value}' from query '{name}' is not numeric")
+            
+            # This query never runs twice at the same time,
+            # so only one thread appends to data and no lock is needed
+            append_value(numeric_value)
+            
+            # Update timestamps (shared across all queries).
+            # deque.append() is atomic and maxlen bounds the size,
+            # so no lock or ordering check is needed
+            append_timestamp(get_time())
+            
+            # Write data point to file
+            write_data_point(column_values)
+            
+            return column_values
+        
+        return sample
+    
     @classmethod
     def clear_all_instances(cls):
         """Remove all cached instances"""
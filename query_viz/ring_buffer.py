@@ -0,0 +1,49 @@
+"""
+Fixed-size buffer of numeric samples
+"""
+
+from array import array
+
+
+class RingBuffer:
+    """Keep the most recent values, up to a fixed number.
+    Values are stored unboxed in a contiguous array of doubles,
+    so each of them takes 8 bytes.
+    Only one thread may append to a buffer."""
+
+    def __init__(self, size):
+        """
+        Allocate the buffer.
+
+        Args:
+            size (int): Maximum number of values to keep
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size <= 0:
+            raise ValueError(f"Invalid RingBuffer size: {size}")
+        self._values = array('d', bytes(8 * size))
+        self._size = size
+        # Position of the next value to write
+        self._next = 0
+        # Number of values written, up to size
+        self._count = 0
+
+    def append(self, value):
+        """Add a value, overwriting the oldest one if the buffer is full"""
+        i = self._next
+        self._values[i] = value
+        i += 1
+        self._next = 0 if i == self._size else i
+        if self._count < self._size:
+            self._count += 1
+
+    def to_list(self):
+        """Return the values from the oldest to the most recent"""
+        if self._count < self._size:
+            return self._values[:self._count].tolist()
+        return (self._values[self._next:] + self._values[:self._next]).tolist()
+
+    def __len__(self):
+        return self._count
@@ -0,0 +1,65 @@
+"""
+Pool of daemon threads that run tasks
+"""
+
+import queue
+import threading
+
+
+class WorkerPool:
+    """Run tasks in a fixed number of daemon threads.
+    Unlike ThreadPoolExecutor workers, daemon threads are not joined
+    when the interpreter exits, so a task that never returns (like a query
+    stuck on a dropped connection) can't block the shutdown.
+    Tasks still running at exit are cut off."""
+
+    def __init__(self, workers, name='worker'):
+        """
+        Start the worker threads.
+
+        Args:
+            workers (int): Number of worker threads
+            name (str): Prefix of the thread names
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers <= 0:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        self._workers = workers
+        self._tasks = queue.SimpleQueue()
+        for i in range(workers):
+            thread = threading.Thread(target=self._work, name=f"{name}-{i}")
+            thread.daemon = True
+            thread.start()
+
+    def submit(self, fn, *args):
+        """
+        Schedule fn(*args) to run in a worker thread.
+
+        Returns:
+            threading.Event: Set when the task has finished
+        """
+        done = threading.Event()
+        self._tasks.put((fn, args, done))
+        return done
+
+    def shutdown(self):
+        """Ask the workers to exit after the tasks already submitted.
+        Doesn't wait for them."""
+        for _ in range(self._workers):
+            self._tasks.put(None)
+
+    def _work(self):
+        """Run tasks until shutdown() is called"""
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            fn, args, done = task
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Error in worker thread: {e}")
+            finally:
+                done.set()
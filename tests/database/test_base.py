@@ -2,6 +2,7 @@
 
 import pytest
 from query_viz.database.base import DatabaseConnection, SUCCESS, FAIL
+from query_viz.exceptions import QueryVizError
 
 
 ##  *****
@@ -128,3 +129,71 @@ def test_abstract_methods_are_defined():
     abstract_methods = DatabaseConnection.__abstractmethods__
     expected_methods = {'connect', 'execute_query', 'close'}
     assert abstract_methods == expected_methods
+
+
+@pytest.mark.unit
+def test_try_connect_success(connection_config):
+    """Test that try_connect returns True when connect() succeeds"""
+    conn = ConcreteDatabaseConnection(connection_config, 10)
+    assert conn.try_connect() is True
+    assert conn.status == SUCCESS
+    assert conn.last_error is None
+
+
+@pytest.mark.unit
+def test_try_connect_failure(connection_config):
+    """Test that try_connect returns False and stores the error when connect() fails"""
+    class FailingConnection(ConcreteDatabaseConnection):
+        def connect(self):
+            raise QueryVizError("connection refused")
+    
+    conn = FailingConnection(connection_config, 10)
+    assert conn.try_connect() is False
+    assert conn.status == FAIL
+    assert str(conn.last_error) == "connection refused"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("host, expected", [
+    ('10.0.0.1', (True, '10.0.0.1', None)),
+    ('db-1.example.com', (True, 'db-1.example.com', None)),
+    ('[::1]:3306', (True, '::1', '3306')),
+    ('db:3306', (True, 'db', '3306')),
+])
+def test_is_valid_host_accepts(host, expected):
+    """Test that valid hosts are accepted and split into host and port"""
+    assert DatabaseConnection._is_valid_host(host) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("host", [
+    # Digits and dots are only checked as an IPv4 address
+    '999.999.999.999',
+    '12345',
+    # Without brackets, the last ':' is taken as the port separator
+    '::1',
+    'host:99999',
+    'db\n',
+    '',
+])
+def test_is_valid_host_rejects(host):
+    """Test that invalid hosts are rejected"""
+    assert DatabaseConnection._is_valid_host(host)[0] is False
+
+
+@pytest.mark.unit
+def test_is_valid_host_rejects_port_when_not_allowed():
+    """Test that a port is rejected when allow_port is False"""
+    assert DatabaseConnection._is_valid_host('db:3306', allow_port=False)[0] is False
+
+
+@pytest.mark.unit
+def test_is_valid_host_result_is_cached():
+    """Test that repeated validations of the same host are served from the cache"""
+    DatabaseConnection._is_valid_host.cache_clear()
+    first = DatabaseConnection._is_valid_host('db-1.example.com')
+    second = DatabaseConnection._is_valid_host('db-1.example.com')
+    assert second == first
+    info = DatabaseConnection._is_valid_host.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
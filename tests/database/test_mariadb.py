@@ -78,6 +78,25 @@ def test_mariadb_connection_close(mariadb_config):
     assert conn.pool is None
 
 
+def test_mariadb_default_pool_size(mariadb_config):
+    """Test that MariaDBConnection uses the default pool_size if it's not specified."""
+    config = mariadb_config.copy()
+    config['name'] = inspect.currentframe().f_code.co_name
+    
+    conn = MariaDBConnection(config, db_timeout=5)
+    assert conn.config['pool_size'] == MariaDBConnection.defaults['pool_size']
+
+
+def test_mariadb_invalid_pool_size(mariadb_config):
+    """Test that MariaDBConnection.validate_config() rejects a non-positive pool_size."""
+    config = mariadb_config.copy()
+    config['name'] = inspect.currentframe().f_code.co_name
+    config['pool_size'] = 0
+    
+    with pytest.raises(QueryVizError, match=r".*'pool_size' must be a positive integer.*"):
+        MariaDBConnection.validate_config(config)
+
+
 def test_mariadb_nothing_to_close(mariadb_config):
     """Test that MariaDBConnection raises an error on close() if no connection was open."""
     # Use unique name for this test
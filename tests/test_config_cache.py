@@ -0,0 +1,112 @@
+"""Tests for the validated configuration cache"""
+
+import os
+import shutil
+import stat
+import pytest
+import yaml
+
+import query_viz.core
+from query_viz import QueryViz
+from query_viz.core import CONFIG_CACHE_SUFFIX
+
+
+TEMPLATE_FILE = os.path.join(os.path.dirname(__file__), '..', 'config.yaml.template')
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """A copy of the configuration template in a temporary directory."""
+    path = tmp_path / 'config.yaml'
+    shutil.copy(TEMPLATE_FILE, path)
+    return str(path)
+
+
+def load(config_file):
+    """Load the configuration with a new QueryViz instance."""
+    qv = QueryViz(0, config_file)
+    qv.load_config()
+    return qv
+
+
+def fail_yaml_load(*args, **kwargs):
+    raise AssertionError("The YAML file should not be parsed")
+
+
+@pytest.mark.unit
+def test_config_cache_hit(config_file, monkeypatch):
+    """Test that an unchanged configuration is loaded from the cache."""
+    expected = load(config_file).config
+    assert os.path.exists(config_file + CONFIG_CACHE_SUFFIX)
+    
+    monkeypatch.setattr(query_viz.core.yaml, 'load', fail_yaml_load)
+    qv = load(config_file)
+    assert qv.config == expected
+    assert qv.interval == expected['interval']
+
+
+@pytest.mark.unit
+def test_config_cache_miss_after_yaml_change(config_file):
+    """Test that the cache is ignored when the YAML file changes."""
+    load(config_file)
+    
+    with open(config_file, 'a') as f:
+        f.write('\ninterval: 7\n')
+    qv = load(config_file)
+    assert qv.config['interval'] == 7
+    assert qv.interval == 7
+
+
+@pytest.mark.unit
+def test_config_cache_miss_after_code_change(config_file, monkeypatch):
+    """Test that the cache is ignored when the query-viz code changes."""
+    load(config_file)
+    
+    monkeypatch.setattr(query_viz.core, '_source_fingerprint', lambda: 'changed')
+    parsed = []
+    real_load = query_viz.core.yaml.load
+    def counting_load(*args, **kwargs):
+        parsed.append(True)
+        return real_load(*args, **kwargs)
+    monkeypatch.setattr(query_viz.core.yaml, 'load', counting_load)
+    load(config_file)
+    assert parsed
+
+
+@pytest.mark.unit
+def test_config_cache_is_private(config_file):
+    """Test that only the owner can read the cache, which contains passwords."""
+    os.chmod(config_file, 0o644)
+    load(config_file)
+    mode = stat.S_IMODE(os.stat(config_file + CONFIG_CACHE_SUFFIX).st_mode)
+    assert mode == 0o600
+
+
+@pytest.mark.unit
+def test_config_cache_unwritable(config_file, monkeypatch):
+    """Test that the configuration is still loaded if the cache can't be written."""
+    def fail_replace(src, dst):
+        raise PermissionError(13, 'Permission denied', dst)
+    monkeypatch.setattr(query_viz.core.os, 'replace', fail_replace)
+    
+    qv = load(config_file)
+    assert qv.config['connections']
+    cache_dir = os.path.dirname(config_file)
+    assert os.listdir(cache_dir) == ['config.yaml']
+
+
+@pytest.mark.unit
+def test_config_cache_keeps_warnings(config_file, capsys):
+    """Test that validation warnings are printed again when the cache is used."""
+    with open(config_file) as f:
+        config = yaml.safe_load(f)
+    unused_query = dict(config['queries'][0], name='unused-query')
+    config['queries'].append(unused_query)
+    with open(config_file, 'w') as f:
+        yaml.safe_dump(config, f)
+    
+    for run in ('cold', 'warm'):
+        load(config_file)
+        output = capsys.readouterr().out
+        assert "Warning: Unused queries found:" in output, run
+        assert "  - unused-query" in output, run
@@ -0,0 +1,158 @@
+"""Tests for DataFile"""
+
+import os
+import pytest
+from query_viz.data_file import DataFile
+
+
+##  *****
+##  Mocks
+##  *****
+
+
+class MockQuery:
+    """Minimal query object, with the settings DataFile reads"""
+    
+    def __init__(self, settings):
+        self.settings = settings
+    
+    def get_setting(self, setting_name, default_value=None):
+        return self.settings.get(setting_name, default_value)
+
+
+##  *****
+##  Tests
+##  *****
+
+
+@pytest.fixture
+def query_settings():
+    """Settings of a recurring query with a Temporal Column"""
+    return {
+        'name': 'test_query',
+        'description': 'Test query',
+        'interval': 10,
+        'columns': ['time', 'value'],
+        'on_rotation_keep_datapoints': 4,
+        'time_type': 'timestamp',
+        'on_file_rotation_keep_history': False
+    }
+
+
+@pytest.fixture
+def data_file(query_settings, tmp_path):
+    """An open DataFile in a temporary output dir"""
+    DataFile.clear_instances()
+    data_file = DataFile(MockQuery(query_settings), str(tmp_path))
+    data_file.open()
+    yield data_file
+    data_file.close()
+    DataFile.clear_instances()
+
+
+def read_data_lines(data_file):
+    """Return the lines of the Data File, without the header comments"""
+    with open(data_file.get_filepath()) as f:
+        return [line for line in f if not line.startswith('#')]
+
+
+@pytest.mark.unit
+def test_close_during_flush(data_file, monkeypatch):
+    """Test that a DataFile can be closed by the thread that is flushing it"""
+    write_pending_lines = DataFile._write_pending_lines
+    closed = []
+    def write_and_close(self):
+        write_pending_lines(self)
+        # Like a signal handler that runs in the middle of flush().
+        # close() calls this method too, so it only closes the file once
+        if not closed:
+            closed.append(True)
+            self.close()
+    monkeypatch.setattr(DataFile, '_write_pending_lines', write_and_close)
+    
+    data_file.write_data_point([1000, 1])
+    data_file.flush()
+    
+    assert not data_file.is_open()
+    assert read_data_lines(data_file) == ['1000 1\n']
+
+
+def read_file(data_file):
+    """Return the whole content of the Data File"""
+    with open(data_file.get_filepath()) as f:
+        return f.read()
+
+
+def write_points(data_file, first, count):
+    """Write count data points with consecutive timestamps.
+    Return the results of write_data_point()"""
+    return [data_file.write_data_point([t, t * 10]) for t in range(first, first + count)]
+
+
+@pytest.mark.unit
+def test_flush_writes_pending_lines(data_file):
+    """Test that data points are written to the file when it's flushed"""
+    write_points(data_file, 1000, 3)
+    # Data points are buffered until the file is flushed
+    assert read_data_lines(data_file) == []
+    
+    data_file.flush()
+    content = read_file(data_file)
+    assert content.startswith("# Data file created by Query-Viz\n")
+    assert "# Query name: test_query\n" in content
+    assert "# Columns: time, value\n" in content
+    assert read_data_lines(data_file) == ['1000 10000\n', '1001 10010\n', '1002 10020\n']
+    assert data_file.get_point_count() == 3
+
+
+@pytest.mark.unit
+def test_rotation_after_threshold(data_file):
+    """Test that the file is only rotated after rotation_threshold points,
+    and that it keeps the headers and max_points lines"""
+    assert data_file.max_points == 4
+    assert data_file.rotation_threshold == 6
+    
+    assert write_points(data_file, 1000, 6) == [False] * 6
+    data_file.flush()
+    assert len(read_data_lines(data_file)) == 6
+    
+    assert data_file.write_data_point([1006, 10060]) is True
+    content = read_file(data_file)
+    assert content.startswith("# Data file created by Query-Viz\n")
+    assert "# Columns: time, value\n" in content
+    assert read_data_lines(data_file) == [
+        '1003 10030\n', '1004 10040\n', '1005 10050\n', '1006 10060\n'
+    ]
+    assert data_file.get_point_count() == 4
+    assert not os.path.exists(data_file.get_filepath() + '.tmp')
+
+
+@pytest.mark.unit
+def test_append_after_rotation(data_file):
+    """Test that data points written after a rotation go to the new file"""
+    write_points(data_file, 1000, 7)
+    
+    write_points(data_file, 1007, 2)
+    data_file.flush()
+    assert read_data_lines(data_file) == [
+        '1003 10030\n', '1004 10040\n', '1005 10050\n', '1006 10060\n',
+        '1007 10070\n', '1008 10080\n'
+    ]
+    assert read_file(data_file).count("# Data file created by Query-Viz\n") == 1
+
+
+@pytest.mark.unit
+def test_close_writes_pending_lines(data_file):
+    """Test that closing the file writes the buffered data points"""
+    write_points(data_file, 1000, 2)
+    data_file.close()
+    assert not data_file.is_open()
+    assert read_data_lines(data_file) == ['1000 10000\n', '1001 10010\n']
+
+
+@pytest.mark.unit
+def test_write_to_closed_file(data_file):
+    """Test that writing to a closed file fails"""
+    data_file.close()
+    with pytest.raises(RuntimeError, match="is not open"):
+        data_file.write_data_point([1000, 10000])
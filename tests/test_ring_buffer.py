@@ -0,0 +1,35 @@
+"""Tests for RingBuffer"""
+
+from collections import deque
+import pytest
+
+from query_viz.ring_buffer import RingBuffer
+
+
+@pytest.mark.unit
+def test_ring_buffer_empty():
+    """Test that a new buffer contains no values"""
+    buffer = RingBuffer(3)
+    assert len(buffer) == 0
+    assert buffer.to_list() == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 7, 9, 10])
+def test_ring_buffer_matches_deque(count):
+    """Test partial fill and wrap-around against a bounded deque"""
+    buffer = RingBuffer(3)
+    expected = deque(maxlen=3)
+    for i in range(count):
+        buffer.append(i * 1.5)
+        expected.append(i * 1.5)
+    assert buffer.to_list() == list(expected)
+    assert len(buffer) == len(expected)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [0, -1])
+def test_ring_buffer_invalid_size(size):
+    """Test that the size must be positive"""
+    with pytest.raises(ValueError, match="Invalid RingBuffer size"):
+        RingBuffer(size)
@@ -0,0 +1,56 @@
+"""Tests for WorkerPool"""
+
+import threading
+import pytest
+
+from query_viz.worker_pool import WorkerPool
+
+
+@pytest.mark.unit
+def test_worker_pool_runs_tasks():
+    """Test that submitted tasks run, and their events are set when they finish"""
+    pool = WorkerPool(2)
+    results = []
+    done = [pool.submit(results.append, i) for i in range(5)]
+    for event in done:
+        assert event.wait(5)
+    pool.shutdown()
+    assert sorted(results) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.unit
+def test_worker_pool_survives_errors():
+    """Test that a failing task doesn't stop its worker"""
+    pool = WorkerPool(1)
+    def fail():
+        raise RuntimeError("task failed")
+    assert pool.submit(fail).wait(5)
+    results = []
+    assert pool.submit(results.append, 1).wait(5)
+    pool.shutdown()
+    assert results == [1]
+
+
+@pytest.mark.unit
+def test_worker_pool_uses_daemon_threads():
+    """Test that workers don't block the interpreter exit"""
+    pool = WorkerPool(1, name='test-pool')
+    started = threading.Event()
+    release = threading.Event()
+    def block():
+        started.set()
+        release.wait()
+    pool.submit(block)
+    assert started.wait(5)
+    workers = [t for t in threading.enumerate() if t.name.startswith('test-pool-')]
+    assert workers and all(t.daemon for t in workers)
+    release.set()
+    pool.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("workers", [0, -1])
+def test_worker_pool_invalid_size(workers):
+    """Test that the number of workers must be positive"""
+    with pytest.raises(ValueError, match="Invalid number of workers"):
+        WorkerPool(workers)